@@ -3,21 +3,20 @@
 if __name__ != "__main__":
     raise ImportError("snape/__main__.py may only be used as main script")
 
+import importlib.util
+import os
 import sys
-from pathlib import Path
 
 if sys.version_info.major < 3 or sys.version_info.minor < 7:
     print("At least python 3.7 is required to run snape")
     exit(2)
 
-try:
-    import snape
-except ImportError:
-    sys.path.append(str(Path(__file__).parent.parent.expanduser().resolve().absolute()))
-
-import traceback
+# When running from the repository, the package directory must be added to the path first.
+# The shell scripts pass the real path of this file, so the path does not need to be resolved.
+if importlib.util.find_spec("snape") is None:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from snape.util import log
+from snape.util import log, is_debug_enabled
 from snape.annotations import SnapeCancel
 from snape.cli import main
 
@@ -26,6 +25,9 @@ try:
 except SnapeCancel:
     exit(0)
 except Exception as e:
-    log("\n".join(traceback.format_exception(e)))
+    # The traceback is only formatted if it is logged
+    if is_debug_enabled():
+        import traceback
+        log("\n".join(traceback.format_exception(e)))
     print(e, file=sys.stderr)
     exit(1)
@@ -5,7 +5,8 @@ from typing import TypedDict, NewType
 __all__ = [
     "ShellInfo",
     "VirtualEnv",
-    "SnapeCancel"
+    "SnapeCancel",
+    "PipError"
 ]
 
 ShellInfo = TypedDict("ShellInfo", {
@@ -23,3 +24,14 @@ VirtualEnv = NewType("VirtualEnv", Path)
 class SnapeCancel(Warning):
     """If raised, the application should terminate without an error."""
     pass
+
+
+class PipError(RuntimeError):
+    """Raised if a ``pip`` command terminated with a non-zero exit code."""
+
+    def __init__(self, message: str, returncode: int, stderr: bytes):
+        super().__init__(message)
+        self.returncode = returncode
+        "The exit code of ``pip``"
+        self.stderr = stderr
+        "The error output of ``pip``"
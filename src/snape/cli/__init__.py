@@ -1,6 +1,6 @@
 import snape.config
 from snape.cli._parser import parser
-from snape.cli.commands import *
+from snape.cli import commands
 from snape.cli.main import main
 
 __all__ = [
@@ -9,8 +9,5 @@ __all__ = [
     "main"
 ]
 
-# Mark the names of all snape arguments as illegal venv names
-snape.config.FORBIDDEN_ENV_NAMES.extend(parser._option_string_actions.keys())
-
-# Mark the names of all subcommands as illegal venv names
-snape.config.FORBIDDEN_ENV_NAMES.extend(parser._actions[-1].choices.keys())
+# Mark the names of all snape arguments and subcommands as illegal venv names
+snape.config.FORBIDDEN_ENV_NAMES.update(parser._option_string_actions, commands.COMMAND_MODULES)
@@ -60,9 +60,43 @@ technical:
   That installation must have the venv package installed and should not be located inside a virtual environment.\
     """
 
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """
+    An argument parser which reuses a single help formatter to validate all arguments added to it.
+
+    ``add_argument`` creates a new formatter to check the metavar of each argument, which queries the terminal size
+    every time. The formatter used for validation does not keep any state, so it is only created once per parser.
+    The formatters used to print help and usage are not affected by this.
+
+    Subcommand parsers use this class as well, as ``add_subparsers`` defaults to the class of its parser.
+    """
+    _validation_formatter = None
+
+    def add_argument(self, *args, **kwargs):
+        # Only replace the formatter while the argument is validated
+        self._get_formatter = self._get_validation_formatter
+        try:
+            return super().add_argument(*args, **kwargs)
+        finally:
+            del self._get_formatter
+
+    def error(self, message):
+        # Only the selected subcommand may have been registered (see ``snape.cli.main``), but the usage printed along
+        # with the error message must list all of them
+        from snape.cli.commands import load_commands
+        load_commands()
+        super().error(message)
+
+    def _get_validation_formatter(self) -> argparse.HelpFormatter:
+        if self._validation_formatter is None:
+            self._validation_formatter = argparse.ArgumentParser._get_formatter(self)
+        return self._validation_formatter
+
+
 # The parser of the application.
 # For more information, see the ``subcommands`` object.
-parser = argparse.ArgumentParser(
+parser = _ArgumentParser(
     prog="snape",
     description=_DESCRIPTION,
     formatter_class=argparse.RawDescriptionHelpFormatter
@@ -91,6 +125,8 @@ subcommands = parser.add_subparsers(title="commands", help=None, required=True)
 The object containing all subcommands. The application will only run if a subcommand is given.
 
 All subcommands (e.g. new/delete) are defined in separate files (e.g. snape/cli/commands/new.py).
+Those files are only imported when needed, so each subcommand must be listed in
+``snape.cli.commands.COMMAND_MODULES``.
 Each of these subcommands can implement custom logic in a function.
 That function receives all arguments passed to the subcommand and can then process them.
 The function must be registered as default for the ``func`` parameter to that subcommand.
@@ -1,16 +1,7 @@
-from .attach import snape_attach
-from .clean import snape_clean
-from .delete import snape_delete
-from .detach import snape_detach
-from .env import snape_env
-from .execute import snape_exec
-from .freeze import snape_freeze
-from .help import snape_help
-from .env import snape_env
-from .new import snape_new
-from .setup import snape_setup_init, snape_setup_remove
-from .status import snape_status
-from .upgrade import snape_upgrade
+import importlib
+from typing import Dict
+
+from snape.cli._parser import subcommands
 
 __all__ = [
     "snape_attach",
@@ -26,4 +17,74 @@ __all__ = [
     "snape_setup_remove",
     "snape_status",
     "snape_upgrade",
+    "COMMAND_MODULES",
+    "load_command",
+    "load_commands",
 ]
+
+# The module defining each subcommand (including aliases), relative to this package.
+# A subcommand module registers its parser when it is imported, which is only done if the subcommand is used.
+COMMAND_MODULES: Dict[str, str] = {
+    "attach": "attach",
+    "possess": "attach",
+    "clean": "clean",
+    "delete": "delete",
+    "rm": "delete",
+    "detach": "detach",
+    "env": "env",
+    "exec": "execute",
+    "freeze": "freeze",
+    "help": "help",
+    "new": "new",
+    "setup": "setup",
+    "status": "status",
+    "upgrade": "upgrade",
+}
+
+# The module defining each subcommand function, relative to this package
+_FUNCTION_MODULES: Dict[str, str] = {
+    "snape_attach": "attach",
+    "snape_clean": "clean",
+    "snape_delete": "delete",
+    "snape_detach": "detach",
+    "snape_env": "env",
+    "snape_exec": "execute",
+    "snape_freeze": "freeze",
+    "snape_help": "help",
+    "snape_new": "new",
+    "snape_setup_init": "setup",
+    "snape_setup_remove": "setup",
+    "snape_status": "status",
+    "snape_upgrade": "upgrade",
+}
+
+
+def load_command(name: str) -> None:
+    """
+    Imports the module of a subcommand, which registers its parser at ``snape.cli._parser.subcommands``.
+
+    :param name: The name of the subcommand or one of its aliases, must be a key of ``COMMAND_MODULES``.
+    """
+    importlib.import_module(f"{__name__}.{COMMAND_MODULES[name]}")
+
+
+def load_commands() -> None:
+    """
+    Imports the modules of all subcommands, which registers all of their parsers.
+    Required before listing all subcommands, e.g. when printing the help of snape itself.
+    """
+    for module in sorted(set(COMMAND_MODULES.values())):
+        importlib.import_module(f"{__name__}.{module}")
+
+    # List the subcommands in the order of ``COMMAND_MODULES``, no matter which of them was registered first
+    order = {name: index for index, name in enumerate(COMMAND_MODULES)}
+    for name in sorted(subcommands.choices, key=order.__getitem__):
+        subcommands.choices[name] = subcommands.choices.pop(name)
+    subcommands._choices_actions.sort(key=lambda action: order[action.dest])
+
+
+# Subcommand functions are imported on first access
+def __getattr__(name):
+    if name in _FUNCTION_MODULES:
+        return getattr(importlib.import_module(f"{__name__}.{_FUNCTION_MODULES[name]}"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
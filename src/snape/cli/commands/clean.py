@@ -37,7 +37,7 @@ def snape_clean(
     # Global files
     unknown_global_files = []
     log("Collecting unknown files at", env_var.SNAPE_ROOT)
-    global_env_files = list(map(lambda env: env_var.SNAPE_ROOT_PATH / env, os.listdir(env_var.SNAPE_ROOT_PATH)))
+    global_env_files = [env_var.SNAPE_ROOT_PATH / env for env in os.listdir(env_var.SNAPE_ROOT_PATH)]
     global_envs = get_global_snape_envs()
     no_envs = list(set(global_env_files) - set(global_envs))
     log("No venvs:", [*map(str, no_envs)])
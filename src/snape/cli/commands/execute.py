@@ -10,6 +10,7 @@ from snape.config import SHELLS
 from snape.util import log, info
 from snape.cli._parser import subcommands
 from snape.virtualenv import get_snape_env_path, ensure_virtual_env
+from snape.virtualenv.util import SUBPROCESS_CLOSE_FDS
 
 def snape_exec(
         *,
@@ -31,7 +32,7 @@ def snape_exec(
 
     ensure_virtual_env(snape_env)
 
-    python = str(snape_env / "bin/python")
+    python = os.path.join(snape_env, "bin/python")
 
     if working_dir is not None and not Path(working_dir).is_dir():
         raise NotADirectoryError(f"Invalid working directory specified: {working_dir}")
@@ -49,7 +50,7 @@ def snape_exec(
             python_commands = ";".join(cmd)
             log("$", python, "-c", python_commands)
             info("$ " + "\n$ ".join(cmd))
-            process = subprocess.run([python, "-c", python_commands])
+            process = subprocess.run([python, "-c", python_commands], close_fds=SUBPROCESS_CLOSE_FDS)
         else:
             # Run in sub-shell
             shell: str = env_var.SHELL
@@ -58,9 +59,10 @@ def snape_exec(
                 return
 
             shell_info = SHELLS[shell]
-            activate_file = snape_env / shell_info["activate_file"]
+            activate_file = os.path.join(snape_env, shell_info["activate_file"])
             activate_command = f"source '{activate_file}'"
-            command = " ".join(map(lambda s: quote + s.replace(quote, '\\' + quote) + quote, cmd))
+            escaped_quote = "\\" + quote
+            command = " ".join(f"{quote}{part.replace(quote, escaped_quote)}{quote}" for part in cmd)
 
             if py_script:
                 log(f"Running script {cmd[0]} using {python}")
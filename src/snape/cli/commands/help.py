@@ -3,6 +3,7 @@ import sys
 from typing import List
 
 from snape.cli._parser import parser, subcommands
+from snape.cli.commands import load_commands
 from snape.util import log
 
 __all__ = [
@@ -18,6 +19,9 @@ def snape_help(
 
     For argument documentation, see ``snape_help_parser``.
     """
+    # The help lists all subcommands, so their parsers are required
+    load_commands()
+
     if len(cmd) == 0:
         parser.print_help()
         return
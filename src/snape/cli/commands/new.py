@@ -1,13 +1,14 @@
 import argparse
 from pathlib import Path
-from typing import cast, Optional, List
+from typing import TYPE_CHECKING, Optional, List
 
 import snape.env_var
-from snape.annotations import VirtualEnv
 from snape.cli._parser import subcommands
 from snape.util import log, info
-from snape.virtualenv import create_new_snape_env, get_snape_env_path, install_requirements, is_virtual_env, \
-    get_env_packages, install_packages
+from snape.virtualenv import create_new_snape_env, get_snape_env_path, is_virtual_env, get_env_packages, install_all
+
+if TYPE_CHECKING:
+    from snape.annotations import VirtualEnv
 
 __all__ = [
     "snape_new"
@@ -35,11 +36,15 @@ def snape_new(
 
     requirements_path = None if requirements is None else Path(requirements)
 
-    is_requirements_file = requirements is not None and requirements_path.is_file()
-    is_requirements_env = requirements is not None and is_virtual_env(requirements_path)
-
-    if requirements and not is_requirements_env and not is_requirements_file:
-        raise FileNotFoundError(f"Requirements file/venv not found: {requirements_path}")
+    # Classify the requirements source, a file takes precedence over a venv
+    is_requirements_file = is_requirements_env = False
+    if requirements:
+        if requirements_path.is_file():
+            is_requirements_file = True
+        elif is_virtual_env(requirements_path):
+            is_requirements_env = True
+        else:
+            raise FileNotFoundError(f"Requirements file/venv not found: {requirements_path}")
 
     if not overwrite:
         overwrite = None
@@ -50,26 +55,31 @@ def snape_new(
         return
 
     # Check whether requirements must be installed into the new environment
+    requirements_files = []
+    install = []
     if requirements is not None:
         if is_requirements_file:
             log("Requirements file:", requirements_path)
-            install_requirements(new_env, requirements_path, no_output=requirements_quiet)
+            requirements_files.append(requirements_path)
         elif is_requirements_env:
             # Must be a venv from here on
-            requirements_env = cast(VirtualEnv, requirements_path)
-            packages = get_env_packages(requirements_env)
-            if len(packages) == 0:
+            requirements_env: VirtualEnv = requirements_path  # type: ignore[assignment]
+            requirements_env_packages = get_env_packages(requirements_env)
+            if len(requirements_env_packages) == 0:
                 info(f"Note: No additional packages were installed in {requirements_path}")
-
-            install_packages(new_env, packages, no_output=requirements_quiet)
+            install.extend(requirements_env_packages)
 
     if packages:
         log("Installing additional packages:", ", ".join(packages))
-        install_packages(new_env, packages, no_output=requirements_quiet)
+        install.extend(packages)
 
     if install_snape:
         log(f"Installing the snape package from {snape.env_var.SNAPE_REPO_PATH}")
-        install_packages(new_env, [str(snape.env_var.SNAPE_REPO_PATH)], no_output=requirements_quiet)
+        install.append(str(snape.env_var.SNAPE_REPO_PATH))
+
+    # The requirements, additional packages and snape are installed using a single pip call
+    if install or requirements_files:
+        install_all(new_env, install, requirements_files, no_output=requirements_quiet)
 
 
 snape_new_parser = subcommands.add_parser(
@@ -1,13 +1,16 @@
 import argparse
+import functools
+import os
 import shutil
+import stat
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, List, Tuple
 
 from snape import env_var
 from snape.annotations import SnapeCancel
 from snape.cli._parser import subcommands
 from snape.config import SHELLS
-from snape.util import log, info, absolute_path, ask
+from snape.util import log, log_lines, info, absolute_path, ask
 
 __all__ = [
     "snape_setup",
@@ -33,6 +36,46 @@ snape_setup_subcommands = snape_setup_parser.add_subparsers(title="commands", he
 snape_setup_parser.set_defaults(func=snape_setup)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_shell_paths(shell_name: str) -> Tuple[Path, Path, str]:
+    """
+    Resolves the files snape's shell integration works with. The result is cached per shell.
+
+    :param shell_name: The name of the shell, must be a key of ``SHELLS``.
+    :return: The snape shell script, the shell's init file and the line sourcing the script from the init file.
+    """
+    shell = SHELLS[shell_name]
+    snape_shell_script: Path = env_var.SNAPE_REPO_PATH / "init" / f"snape.{shell_name}"
+    init_file: Path = absolute_path(shell["init_file"])
+    source_line: str = f"source '{snape_shell_script}'"
+    # Only used by is_virtual_env function: activate_file = shell["activate_file"]
+    return snape_shell_script, init_file, source_line
+
+
+def _contains_line(file: BinaryIO, line: bytes) -> bool:
+    """
+    Checks whether a file contains the specified line.
+
+    ``snape setup init`` appends its line to the end of the file, so only the tail of the file is read first.
+    The whole file is only scanned if the line is not found there.
+
+    :param file: The file to search, opened in binary mode. Its position is changed by this function.
+    :param line: The line to search for, without a trailing newline.
+    :return: Whether any line of ``file`` equals ``line``.
+    """
+    # Read the last line including the newline before and after it, which may be a CRLF line ending
+    start = max(0, os.fstat(file.fileno()).st_size - len(line) - 3)
+    file.seek(start)
+    tail = file.read()
+    if start == 0:
+        tail = b"\n" + tail
+    if b"\n" + line + b"\n" in tail or b"\n" + line + b"\r\n" in tail or tail.endswith(b"\n" + line):
+        return True
+
+    file.seek(0)
+    return any(file_line.rstrip(b"\r\n") == line for file_line in file)
+
+
 def snape_setup_init() -> None:
     """
     Initialize the snape installation.
@@ -40,35 +83,40 @@ def snape_setup_init() -> None:
     For argument documentation, see ``snape_setup_init_parser``.
     """
     # Get shell-dependent arguments
-    shell = SHELLS[env_var.SHELL]
-    snape_shell_script: Path = env_var.SNAPE_REPO_PATH / "init" / f"snape.{env_var.SHELL}"
-    init_file: Path = absolute_path(shell["init_file"])
-    source_line: str = f"source '{snape_shell_script}'"
-    # Only used by is_virtual_env function: activate_file = shell["activate_file"]
+    snape_shell_script, init_file, source_line = _get_shell_paths(env_var.SHELL)
 
-    log("Shell:          ", env_var.SHELL)
-    log("Shell init file:", init_file)
-    log("Snape command:  ", source_line)
+    log_lines(
+        f"Shell:           {env_var.SHELL}",
+        f"Shell init file: {init_file}",
+        f"Snape command:   {source_line}"
+    )
 
     # The snape shell script must exist, otherwise this is not allowed to proceed
     if not snape_shell_script.is_file():
         raise FileNotFoundError(f"Snape shell script not found: {snape_shell_script}")
 
-    if not init_file.is_file():
+    # The init file is only opened for writing if the source line is missing, it may be read-only otherwise
+    separator = b""
+    try:
+        with open(init_file, "rb") as f:
+            # Check whether the source line exists
+            if _contains_line(f, source_line.encode()):
+                info(f"Snape has already been initialized for the {env_var.SHELL} shell, nothing changed")
+                raise SnapeCancel()
+
+            # Start a new line if the file does not end with one
+            end = f.seek(0, os.SEEK_END)
+            if end > 0:
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    separator = b"\n"
+    except FileNotFoundError:
         log("Creating file", init_file)
-        with open(init_file, "w"): pass
-
-    # Check whether the source line exists
-    with open(init_file, "r") as f:
-        content = f.readlines()
-        if source_line in content or source_line+"\n" in content:
-            info(f"Snape has already been initialized for the {env_var.SHELL} shell, nothing changed")
-            raise SnapeCancel()
-        log(source_line, "not found in", init_file)
+    log(source_line, "not found in", init_file)
 
     # Write the source line
-    with open(init_file, "a") as init_file_stream:
-        print(source_line, file=init_file_stream)
+    with open(init_file, "ab") as f:
+        f.write(separator + source_line.encode() + b"\n")
 
     info("Initialized snape for", env_var.SHELL, "at", init_file)
 
@@ -93,52 +141,59 @@ def snape_setup_remove(
 
     For argument documentation, see ``snape_setup_remove_parser``.
     """
-    # Get shell-dependent arguments
-    shell = SHELLS[env_var.SHELL]
-    snape_shell_script: Path = env_var.SNAPE_REPO_PATH / "init" / f"snape.{env_var.SHELL}"
-    init_file: Path = absolute_path(shell["init_file"])
-    source_line: str = f"source '{snape_shell_script}'"
-    # Only used by is_virtual_env function: activate_file = shell["activate_file"]
-
-    log("Shell:          ", env_var.SHELL)
-    log("Shell init file:", init_file)
-    log("Snape command:  ", source_line)
+    remove_root = "root" in argv
+    remove_init = "init" in argv
 
     # Check if any arguments were given
-    if len(argv) == 0:
+    if not (remove_root or remove_init):
         log("No arguments given")
         info("Nothing to do")
+        return
 
-    if "root" in argv:
+    if remove_root:
         log("Attempting to remove", env_var.SNAPE_ROOT_PATH)
         if ask("Are you sure you want to remove all global environments?", default=False):
             log("Removing", env_var.SNAPE_ROOT_PATH)
-            shutil.rmtree(env_var.SNAPE_ROOT_PATH)
-            if env_var.SNAPE_ROOT_PATH.is_dir():
-                raise RuntimeError(f"Could not remove {env_var.SNAPE_ROOT_PATH}")
-            else:
-                log("Removed", env_var.SNAPE_ROOT_PATH)
-                info("Successfully removed all global environments")
-
-    if "init" in argv:
-        with open(init_file, "r") as f:
-            content = f.readlines()
-            if source_line in content:
-                content.remove(source_line)
-                new_content = content
-            elif source_line+"\n" in content:
-                content.remove(source_line+"\n")
-                new_content = content
-            else:
+            try:
+                shutil.rmtree(env_var.SNAPE_ROOT_PATH)
+            except OSError as e:
+                raise RuntimeError(f"Could not remove {env_var.SNAPE_ROOT_PATH}") from e
+            log("Removed", env_var.SNAPE_ROOT_PATH)
+            info("Successfully removed all global environments")
+
+    if remove_init:
+        # Get shell-dependent arguments
+        snape_shell_script, init_file, source_line = _get_shell_paths(env_var.SHELL)
+
+        log_lines(
+            f"Shell:           {env_var.SHELL}",
+            f"Shell init file: {init_file}",
+            f"Snape command:   {source_line}"
+        )
+
+        source_line_bytes = source_line.encode()
+        with open(init_file, "rb") as f:
+            if not _contains_line(f, source_line_bytes):
                 info("Snape has not yet been initialized for", env_var.SHELL)
-                new_content = None
-            del content
-
-        if new_content is not None:
-            log("Writing edited file contents to", init_file)
-            with open(init_file, "w") as f:
-                f.writelines(new_content)
-            info("Successfully removed snape from", env_var.SHELL)
+                return
+
+            # Copy all other lines to a temporary file which then replaces the init file
+            import tempfile
+            f.seek(0)
+            new_init_file = tempfile.NamedTemporaryFile("wb", dir=init_file.parent, delete=False)
+            try:
+                with new_init_file:
+                    new_init_file.writelines(line for line in f if line.rstrip(b"\r\n") != source_line_bytes)
+
+                log("Writing edited file contents to", init_file)
+                os.chmod(new_init_file.name, stat.S_IMODE(os.stat(init_file).st_mode))
+                os.replace(new_init_file.name, init_file)
+            except BaseException:
+                # Do not leave the temporary file behind, the init file is unchanged
+                os.unlink(new_init_file.name)
+                raise
+
+        info("Successfully removed snape from", env_var.SHELL)
 
 
 snape_setup_remove_parser = snape_setup_subcommands.add_parser(
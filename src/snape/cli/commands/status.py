@@ -1,17 +1,23 @@
 import argparse
 import json
-from pathlib import Path
+import os
+import sys
 from typing import Any, Dict
 
 from snape import env_var
 from snape.cli._parser import subcommands
-from snape.util import log
-from snape.virtualenv import get_global_snape_envs, get_local_snape_envs, get_snape_env_name
+from snape.util import log, is_debug_enabled
+from snape.virtualenv import get_global_snape_envs, get_local_snape_envs, get_snape_env_name, \
+    is_global_snape_env_path
 
 __all__ = [
     "snape_status"
 ]
 
+# Formats of an environment listed by ``snape status``, the active environment is highlighted
+_ACTIVE_ENV_FORMAT = "    * \033[32m{}\033[0m"
+_INACTIVE_ENV_FORMAT = "    * {}"
+
 
 def snape_status(
         raw: bool
@@ -24,8 +30,9 @@ def snape_status(
     # Assemble information
     python_venv = env_var.VIRTUAL_ENV
 
-    snape_current_env = env_var.VIRTUAL_ENV.split("/")[-1] if env_var.VIRTUAL_ENV else None
-    if snape_current_env and snape_current_env != env_var.SNAPE_VENV and env_var.SNAPE_ROOT_PATH not in Path(python_venv).parents:
+    snape_current_env = os.path.basename(python_venv) if python_venv else None
+    if snape_current_env and snape_current_env != env_var.SNAPE_VENV and \
+            not is_global_snape_env_path(python_venv, check_exists=False):
         # Neither local nor global snape managed environment
         snape_current_env = None
 
@@ -34,47 +41,54 @@ def snape_status(
     snape_local_envs = get_local_snape_envs()
     snape_local_name = env_var.SNAPE_VENV
 
-    # All variables constructed locally should be printed out.
-    # All functional objects must be removed from the output.
-    status = locals()
-    status.pop("raw")
-    log(json.dumps(status, indent=4, default=str))
-
-    # If requested: Output the collected information as json.
-    if raw:
-        # Print everything
-        print(json.dumps(status, indent=4, default=str))
-        return status
-
-    snape_global_envs_str = []
-    for env in snape_global_envs:
-        if str(env) == python_venv:
-            snape_global_envs_str.append(f"    * \033[32m{get_snape_env_name(env)}\033[0m")
-        else:
-            snape_global_envs_str.append(f"    * {get_snape_env_name(env)}")
-
-    snape_local_envs_str = []
-    for env in snape_local_envs:
-        if str(env) == python_venv:
-            snape_local_envs_str.append(f"    * \033[32m{env.parent}\033[0m")
-        else:
-            snape_local_envs_str.append(f"    * {env.parent}")
-
-    print("Python venv:")
-    print("  Current:       ", python_venv)
-    print("  Snape name:    ", get_snape_env_name(python_venv) if python_venv is not None else None)
+    status = {
+        "python_venv": python_venv,
+        "snape_current_env": snape_current_env,
+        "snape_global_root": snape_global_root,
+        "snape_global_envs": snape_global_envs,
+        "snape_local_envs": snape_local_envs,
+        "snape_local_name": snape_local_name,
+    }
+    # The json representation is only built if it is logged or printed, and only once
+    if raw or is_debug_enabled():
+        status_json = json.dumps(status, indent=4, default=str)
+        log(status_json)
+
+        # If requested: Output the collected information as json.
+        if raw:
+            # Print everything
+            print(status_json)
+            return status
+
+    python_venv_name = get_snape_env_name(python_venv) if python_venv is not None else None
+
+    # Collect all lines first and write them at once
+    output = [
+        "Python venv:",
+        f"  Current:        {python_venv}",
+        f"  Snape name:     {python_venv_name}",
+    ]
 
     if len(snape_local_envs) != 0:
-        print()
-        print("Local snape environments:")
-        print("\n".join(snape_local_envs_str))
+        output.append("")
+        output.append("Local snape environments:")
+        output.extend(
+            (_ACTIVE_ENV_FORMAT if str(env) == python_venv else _INACTIVE_ENV_FORMAT).format(env.parent)
+            for env in snape_local_envs
+        )
 
     if len(snape_global_envs) != 0:
-        print()
-        print("Global snape environments:")
-        print("  Snape root:   ", snape_global_root)
-        print("  Available environments:")
-        print("\n".join(snape_global_envs_str))
+        output.append("")
+        output.append("Global snape environments:")
+        output.append(f"  Snape root:    {snape_global_root}")
+        output.append("  Available environments:")
+        output.extend(
+            _ACTIVE_ENV_FORMAT.format(python_venv_name) if str(env) == python_venv
+            else _INACTIVE_ENV_FORMAT.format(get_snape_env_name(env))
+            for env in snape_global_envs
+        )
+
+    sys.stdout.write("\n".join(output) + "\n")
     return status
 
 
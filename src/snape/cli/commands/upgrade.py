@@ -1,4 +1,3 @@
-import venv
 from typing import Optional
 
 from snape.cli._parser import subcommands
@@ -12,6 +11,7 @@ def snape_upgrade(env: Optional[str]):
         snape_env = get_snape_env_path(env, False)
     ensure_virtual_env(snape_env)
     print("Upgrading venv at", snape_env)
+    import venv
     venv.main(["--upgrade", str(snape_env)])
 
 
@@ -1,15 +1,44 @@
+import sys
 from typing import Callable, Any, Optional, List
 
 from snape import env_var
 from snape.cli._parser import parser
-from snape.cli.commands import snape_setup_init
+from snape.cli.commands import COMMAND_MODULES, load_command, load_commands
 from snape.config import SHELLS
-from snape.util import log, toggle_io
+from snape.util import log, toggle_io, is_debug_enabled
 
 __all__ = [
     "main"
 ]
 
+# Arguments used by snape itself which are not passed to subcommands
+_SNAPE_ARGS = frozenset({"shell", "func", "quiet", "verbose"})
+
+
+def _load_selected_command(args: List[str]) -> None:
+    """
+    Registers the parser of the subcommand selected by the command line arguments, so the parsers of all other
+    subcommands do not have to be created. If the help of snape itself is requested or no known subcommand is selected,
+    all subcommands are registered to let ``argparse`` list them.
+
+    :param args: The command line arguments passed to snape.
+    """
+    args = iter(args)
+    for arg in args:
+        if arg in ("-h", "--help"):
+            break
+        if arg.startswith("-"):
+            # Skip the values of options like --shell
+            action = parser._option_string_actions.get(arg)
+            if action is not None and action.nargs is None:
+                next(args, None)
+            continue
+        if arg in COMMAND_MODULES and arg != "help":
+            load_command(arg)
+            return
+        break
+    load_commands()
+
 
 def main(args: Optional[List[str]] = None) -> None:
     """
@@ -31,6 +60,7 @@ def main(args: Optional[List[str]] = None) -> None:
 
     :param args: If ``None``, parses the command line arguments (``sys.argv``), the specified arguments otherwise.
     """
+    _load_selected_command(sys.argv[1:] if args is None else args)
     args = parser.parse_args(args=args)
 
     toggle_io(informational=not args.quiet, debug=args.verbose)
@@ -38,21 +68,21 @@ def main(args: Optional[List[str]] = None) -> None:
     if args.shell is not None:
         env_var.__VARS__["SHELL"] = args.shell
 
+    if env_var.SHELL is None:
+        raise KeyError("Could not detect the current shell, set the SHELL variable or use the --shell option")
     if env_var.SHELL not in SHELLS:
         raise KeyError(f"Snape does not support the '{env_var.SHELL}' shell yet")
     log("Enabled shell:", env_var.SHELL)
 
     # Ensure the root directory exists, except when snape is initialized for the first time
-    if args.func != snape_setup_init and env_var.SNAPE_ROOT_PATH is not None and not env_var.SNAPE_ROOT_PATH.is_dir():
+    if args.func.__name__ != "snape_setup_init" and env_var.SNAPE_ROOT_PATH is not None and not env_var.SNAPE_ROOT_PATH.is_dir():
         raise NotADirectoryError(f"Snape root is not a valid directory: {env_var.SNAPE_ROOT_PATH}")
 
     # Done preprocessing
     func: Callable[[Any, ...], None] = args.func
-    delattr(args, "shell")
-    delattr(args, "func")
-    delattr(args, "quiet")
-    delattr(args, "verbose")
+    kwargs = {key: value for key, value in vars(args).items() if key not in _SNAPE_ARGS}
 
-    log(func.__name__ + "(" + ", ".join(map(lambda x: f"{x[0]} = {x[1]}", vars(args).items())) + ')')
+    if is_debug_enabled():
+        log(func.__name__ + "(" + ", ".join(f"{key} = {value}" for key, value in kwargs.items()) + ')')
 
-    func(**vars(args))
+    func(**kwargs)
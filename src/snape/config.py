@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import Final, Dict, List
+from typing import Final, Dict, Set
 
 from snape.annotations import ShellInfo
 
@@ -13,14 +13,13 @@ __all__ = [
 # If installed as package, access the package files
 if "site-packages" in __file__:
     import sys
-    if sys.version_info.minor < 11:
+    if sys.version_info < (3, 9):
         import pkg_resources
         _CONFIG_DIR_PATH = Path(pkg_resources.resource_filename("snape", "config"))
     else:
+        # An installed package is a regular directory, so its files are accessible directly without extracting them
         import importlib.resources
-        with importlib.resources.path("snape", "config") as __f:
-            _CONFIG_DIR_PATH = Path(__f.absolute().resolve())
-        del __f
+        _CONFIG_DIR_PATH = Path(importlib.resources.files("snape") / "config").resolve()
 else:
     _CONFIG_DIR_PATH = Path(__file__).parent / "config"
 
@@ -40,16 +39,18 @@ if not isinstance(SHELLS, dict):
 
 # Forbidden env name configuration
 with open(_ILLEGAL_ENV_NAME_CONFIG, "r") as __f:
-    FORBIDDEN_ENV_NAMES: Final[List[str]] = json.load(__f)
-    """
-    Used to prevent the user from unwanted venv creation when wanting to call a subcommand.
-    
-    If the user tries to create a venv named as any item of this list, an error is thrown (see ``new`` subcommand).
-    The names of options and subcommands are added automatically.
-    """
+    __forbidden_env_names = json.load(__f)
 
-if not isinstance(FORBIDDEN_ENV_NAMES, list):
+if not isinstance(__forbidden_env_names, list):
     raise TypeError("Not a valid env name config file:", _ILLEGAL_ENV_NAME_CONFIG)
 
+FORBIDDEN_ENV_NAMES: Final[Set[str]] = set(__forbidden_env_names)
+"""
+Used to prevent the user from unwanted venv creation when wanting to call a subcommand.
+
+If the user tries to create a venv named as any item of this set, an error is thrown (see ``new`` subcommand).
+The names of options and subcommands are added automatically.
+"""
+
 # Remove temporary stuff
-del __f, _SHELLS_CONFIG, _ILLEGAL_ENV_NAME_CONFIG
+del __f, __forbidden_env_names, _SHELLS_CONFIG, _ILLEGAL_ENV_NAME_CONFIG
@@ -9,27 +9,34 @@ Example:
 """
 
 import os
-from pathlib import Path
 from typing import Final, Optional, List, Dict
 
 from snape.util import absolute_path
 
 # __all__ not listed to not conflict with the __getattr__
 
+# Each variable is read from the environment exactly once
+_SHELL = os.environ.get("SHELL")
+
 __VARS__: Final[Dict[str, Optional[str]]] = {
     # Select the current shell as default.
     # This can be changed via command line option and is applied in ``snape.cli.main``.
-    "SHELL": os.getenv("SHELL").split("/")[-1] if os.getenv("SHELL") is not None else None,
+    # An unset or empty variable results in ``None``.
+    "SHELL": os.path.basename(_SHELL) if _SHELL else None,
 
     # The currently active python environment.
-    "VIRTUAL_ENV": os.getenv("VIRTUAL_ENV"),
+    "VIRTUAL_ENV": os.environ.get("VIRTUAL_ENV"),
 
     # The directory of all global snape environments.
-    "SNAPE_ROOT": os.getenv("SNAPE_ROOT"),
+    "SNAPE_ROOT": os.environ.get("SNAPE_ROOT"),
 
     # The name of local snape environments.
-    "SNAPE_VENV": os.getenv("SNAPE_VENV"),
+    "SNAPE_VENV": os.environ.get("SNAPE_VENV"),
+
+    # If set to 1, pip only installs prebuilt wheels and skips compiling bytecode (see ``install_all``).
+    "SNAPE_FAST_INSTALL": os.environ.get("SNAPE_FAST_INSTALL"),
 }
+del _SHELL
 
 
 # This terrible logic is required to be able to set a variable
@@ -37,18 +44,20 @@ __VARS__: Final[Dict[str, Optional[str]]] = {
 def __getattr__(name):
     if name in __VARS__:
         return __VARS__[name]
-    return globals()[name]
+
+    # Paths derived from environment variables are resolved on first access only.
+    # The result is stored as a module attribute, so this function is not called for it again.
+    if name == "SNAPE_ROOT_PATH":
+        # The directory of all global snape environments. If this is not a directory, the script will throw an error.
+        value = absolute_path(__VARS__["SNAPE_ROOT"]) if __VARS__["SNAPE_ROOT"] is not None else None
+    elif name == "SNAPE_REPO_PATH":
+        # The snape repository root path
+        value = absolute_path(__file__).parent.parent.parent
+    else:
+        return globals()[name]
+    globals()[name] = value
+    return value
 
 
 def list_vars() -> List[str]:
     return list(__VARS__.keys())
-
-
-# Apply environment variables
-
-SNAPE_ROOT_PATH: Final[Optional[Path]] = absolute_path(__VARS__["SNAPE_ROOT"]) \
-    if __VARS__["SNAPE_ROOT"] is not None else None
-"The directory of all global snape environments. If this is not a directory, the script will throw an error."
-
-SNAPE_REPO_PATH: Final[Path] = absolute_path(__file__).parent.parent.parent
-"The snape repository root path"
@@ -1,19 +1,28 @@
-from typing import Optional
+import sys
+from typing import Dict, Optional
 
 __all__ = [
     "info",
     "log",
+    "log_lines",
     "ask",
-    "toggle_io"
+    "toggle_io",
+    "is_debug_enabled"
 ]
 
 INFO: bool = True
 DEBUG: bool = False
 
+# The answers accepted by ``ask`` in lower case
+_ANSWERS: Dict[str, bool] = {"y": True, "n": False}
+
 
 def toggle_io(informational: bool, debug: bool) -> None:
     """
     Toggles whether the ``info`` and ``log`` methods output anything.
+
+    Both methods check the flags on each call instead of being replaced by no-op functions, because other modules
+    bind them at import time (``from snape.util import log``) and would keep calling the replaced functions.
     """
     global INFO, DEBUG
     INFO = informational
@@ -23,6 +32,14 @@ def toggle_io(informational: bool, debug: bool) -> None:
         log("Debug output enabled")
 
 
+def is_debug_enabled() -> bool:
+    """
+    Checks whether debug output is enabled, meaning ``log`` outputs anything.
+    Can be used to skip building expensive log messages which would not be printed anyway.
+    """
+    return DEBUG
+
+
 def info(*message, **kwargs) -> None:
     """
     Output informational messages.
@@ -49,6 +66,18 @@ def log(*message, **kwargs) -> None:
         print("\033[33m+", *message, "\033[0m", **kwargs)
 
 
+def log_lines(*lines: str) -> None:
+    """
+    Output multiple debug log messages at once.
+
+    Formats each line the same way as ``log`` does, but writes all of them to standard output using a single write.
+
+    :param lines: The lines to print, one log message each.
+    """
+    if DEBUG:
+        sys.stdout.write("".join(f"\033[33m+ {line} \033[0m\n" for line in lines))
+
+
 def ask(prompt: str, default: Optional[bool]) -> bool:
     """
     Prompts the user to enter either yes (``y``/``Y``) or no (``n``/``N``).
@@ -64,12 +93,11 @@ def ask(prompt: str, default: Optional[bool]) -> bool:
         default_str = "[y/n]"
     else:
         default_str = "[Y/n]" if default else "[y/N]"
+    question = f"{prompt} {default_str} "
 
     while True:
-        answer = input(f"{prompt} {default_str} ")
-        if answer in ("y", "Y"):
-            return True
-        elif answer in ("n", "N"):
-            return False
+        answer = input(question).lower()
+        if answer in _ANSWERS:
+            return _ANSWERS[answer]
         elif answer == "" and default is not None:
             return default
@@ -1,3 +1,4 @@
+import functools
 import os
 from pathlib import Path
 from typing import Union
@@ -9,8 +10,35 @@ __all__ = [
 
 
 def absolute_path(path: Union[str, os.PathLike[str]]) -> Path:
-    return Path(path).expanduser().resolve().absolute()
+    path = os.fspath(path)
+    # Relative paths depend on the working directory, which may change (see snape exec)
+    if os.path.isabs(path) or path.startswith("~"):
+        return _absolute_path_cached(path)
+    return Path(path).resolve()
+
+
+@functools.lru_cache(maxsize=1024)
+def _absolute_path_cached(path: str) -> Path:
+    # Symbolic links are always resolved, an absolute path may still point into another directory
+    if path.startswith("~"):
+        return Path(path).expanduser().resolve()
+    return Path(path).resolve()
 
 
 def get_dir_size(path: Union[str, os.PathLike[str]]) -> int:
-    return sum(os.path.getsize(f) for f in Path(path).glob('**/*') if f.is_file())
+    # Directory entries already know their type, so only regular files are stat'ed. Symbolic links are not followed.
+    total = 0
+    pending = [os.fspath(path)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            # Directories which are unreadable or were removed in the meantime are skipped
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
@@ -1,6 +1,6 @@
 import os
 import shutil
-import venv as python_venv
+import stat
 from pathlib import Path
 from typing import cast, Generator, Union, Optional, List
 
@@ -33,7 +33,15 @@ def is_global_snape_env_path(env: Path, check_exists: bool = True) -> bool:
         Otherwise, the path contents will only be compared.
     :return: Whether ``env`` is a child directory of ``SNAPE_DIR``.
     """
-    return env_var.SNAPE_ROOT_PATH in absolute_path(env).parents and ((not check_exists) or env.is_dir())
+    root = env_var.SNAPE_ROOT_PATH
+    if root is None:
+        return False
+
+    # Symbolic links are resolved, a link below the root may point outside of it (see ``get_snape_env_name``).
+    # The separator is appended to the root, so only paths inside of it match.
+    if not os.fspath(absolute_path(env)).startswith(os.path.join(root, "")):
+        return False
+    return (not check_exists) or os.path.isdir(env)
 
 
 def is_global_snape_env(env: Union[VirtualEnv, Path]) -> bool:
@@ -61,19 +69,18 @@ def get_snape_env_path(name: Optional[str], local: bool, warn_argument_conflicts
     :exception NameError: Raised if an illegal environment name was specified for a global environment.
     :exception ValueError: Raised if no name was provided when required.
     """
-    if name in FORBIDDEN_ENV_NAMES:
-        raise NameError("Illegal snape venv name: " + str(name))
-
-    if warn_argument_conflicts:
-        if name is None and not local:
-            raise RuntimeError("No environment name provided for global snape environment")
-
+    # The name is ignored for local environments, so it does not have to be checked
     if local:
         return absolute_path(Path.cwd() / env_var.SNAPE_VENV)
 
     if not name:
+        if warn_argument_conflicts and name is None:
+            raise RuntimeError("No environment name provided for global snape environment")
         raise ValueError("No name provided for global snape environment")
 
+    if name in FORBIDDEN_ENV_NAMES:
+        raise NameError("Illegal snape venv name: " + name)
+
     return absolute_path(env_var.SNAPE_ROOT_PATH / name)
 
 
@@ -89,23 +96,16 @@ def get_snape_env_name(_env: Union[str, Path, VirtualEnv]) -> Optional[str]:
     if _env is None:
         return None
 
-    _env = absolute_path(_env)
-
-    if is_global_snape_env_path(_env, check_exists=False):
-        global_env = _env
-        result = []
-
-        while global_env.parent != env_var.SNAPE_ROOT_PATH:
-            result.append(global_env.name)
-            global_env = global_env.parent
-
-        if global_env.parent is None:
-            return None
+    env = os.fspath(absolute_path(_env))
 
-        result.append(global_env.name)
-        return "/".join(reversed(result))
+    if env_var.SNAPE_ROOT_PATH is not None:
+        # All path components below the root make up the name of a global environment
+        prefix = os.path.join(env_var.SNAPE_ROOT_PATH, "")
+        if env.startswith(prefix):
+            return env[len(prefix):].replace(os.sep, "/")
 
-    return _env.name if _env.name == env_var.SNAPE_VENV else None
+    name = os.path.basename(env)
+    return name if name == env_var.SNAPE_VENV else None
 
 
 def create_new_snape_env(env: Path, overwrite: Optional[bool], autoupdate: bool, prompt: Optional[str] = None, env_name: Optional[str] = None) -> Optional[VirtualEnv]:
@@ -130,10 +130,16 @@ def create_new_snape_env(env: Path, overwrite: Optional[bool], autoupdate: bool,
     if env.name in FORBIDDEN_ENV_NAMES:
         raise NameError("Illegal snape venv name: " + env.name)
 
-    if env.is_file():
+    # Stat the path only once to tell missing paths, files and directories apart
+    try:
+        env_mode = os.stat(env).st_mode
+    except OSError:
+        env_mode = 0
+
+    if stat.S_ISREG(env_mode):
         raise NotADirectoryError(f"{env} exists and is neither a directory nor a virtual environment")
 
-    if env.is_dir():
+    if stat.S_ISDIR(env_mode):
         if not is_virtual_env(env):
             raise IsADirectoryError(
                 f"Directory {env} exists and is not an existing environment which could be overwritten"
@@ -147,6 +153,7 @@ def create_new_snape_env(env: Path, overwrite: Optional[bool], autoupdate: bool,
     locality = "global" if is_global_snape_env_path(env, check_exists=False) else "local"
     info(f"Creating {locality} snape environment:", env_name)
     log("Creating virtual environment at", env)
+    import venv as python_venv
     python_venv.create(env, with_pip=True, clear=overwrite, upgrade_deps=autoupdate, prompt=prompt)
     with open(env / ".gitignore", "w") as gitignore:
         print("*", file=gitignore)
@@ -170,13 +177,13 @@ def delete_snape_env(env: VirtualEnv, do_ask: bool, ignore_active: bool) -> None
 
     locality = "global" if is_global_snape_env(env) else "local"
     if (not do_ask) or ask(f"Are you sure you want to delete the {locality} environment '{env_name}'?", False):
-        shutil.rmtree(env)
+        try:
+            shutil.rmtree(env)
+        except OSError as e:
+            raise SystemError(f"Could not delete virtual environment: {env}") from e
     else:
         raise SnapeCancel()
 
-    if env.is_dir():
-        raise SystemError(f"Could not delete virtual environment: {env}")
-
     info(f"Deleted {locality} snape environment", env_name)
 
 
@@ -212,13 +219,15 @@ def iter_local_snape_envs(cwd: Optional[Path] = None) -> Generator[VirtualEnv, N
 
     :param cwd: If ``None``, evaluates from the current working directory, from ``cwd`` otherwise.
     """
-    local_env_dir = cwd or Path.cwd()
+    # Walk the parents as strings, a path object is only created for found environments
+    local_env_dir = os.fspath(cwd) if cwd else os.getcwd()
+    parent_dir = os.path.dirname(local_env_dir)
 
-    while local_env_dir.parent != local_env_dir:
-        local_env = local_env_dir / env_var.SNAPE_VENV
+    while parent_dir != local_env_dir:
+        local_env = os.path.join(local_env_dir, env_var.SNAPE_VENV)
         if is_virtual_env(local_env):
-            yield cast(VirtualEnv, local_env)
-        local_env_dir = local_env_dir.parent
+            yield cast(VirtualEnv, Path(local_env))
+        local_env_dir, parent_dir = parent_dir, os.path.dirname(parent_dir)
 
 
 def get_global_snape_envs() -> List[VirtualEnv]:
@@ -240,14 +249,30 @@ def _get_environments(root: Path) -> List[VirtualEnv]:
     """
     result = []
 
-    if not root.is_dir():
+    # Opening the root fails if it is not a directory, which saves checking it beforehand
+    try:
+        root_entries = os.scandir(root)
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    for env in os.listdir(root):
-        full_path = root / env
-        if is_virtual_env(full_path):
-            result.append(cast(VirtualEnv, full_path))
-        elif full_path.is_dir():
-            result.extend(_get_environments(full_path))
+    # Open directory iterators of the current path, an explicit stack avoids recursive calls for nested directories.
+    # Nested directories are scanned as soon as they are found, so the order of the result is kept.
+    pending = [root_entries]
+    try:
+        while pending:
+            entry = next(pending[-1], None)
+            if entry is None:
+                pending.pop().close()
+                continue
+            # The cached directory information of the entry saves a stat call for plain files
+            if not entry.is_dir():
+                continue
+            # The path of the entry is checked as string, a path object is only created for found environments
+            if is_virtual_env(entry.path):
+                result.append(cast(VirtualEnv, Path(entry.path)))
+            else:
+                pending.append(os.scandir(entry.path))
+    finally:
+        for entries in pending:
+            entries.close()
     return result
-
@@ -1,11 +1,14 @@
-import subprocess
+import os
 from pathlib import Path
-from typing import cast, List
+from typing import TYPE_CHECKING, cast, List, Optional, Sequence, Union
 
 from snape import env_var
-from snape.annotations import VirtualEnv
+from snape.annotations import VirtualEnv, PipError
 from snape.config import SHELLS
-from snape.util import absolute_path, log, info
+from snape.util import absolute_path, log, info, is_debug_enabled
+
+if TYPE_CHECKING:
+    import subprocess
 
 __all__ = [
     "is_virtual_env",
@@ -13,11 +16,12 @@ __all__ = [
     "ensure_virtual_env",
     "get_env_packages",
     "install_packages",
-    "install_requirements"
+    "install_requirements",
+    "install_all"
 ]
 
 
-def is_virtual_env(env: Path) -> bool:
+def is_virtual_env(env: Union[str, Path]) -> bool:
     """
     Checks whether the given path points to a python virtual environment.
     This function is shell dependant and performs its checks depending on the global ``SHELL`` variable.
@@ -25,7 +29,9 @@ def is_virtual_env(env: Path) -> bool:
     :param env: The path to check.
     :return: Whether the specified path points to a directory which contains an activation file and a python binary.
     """
-    return env.is_dir() and (env / SHELLS[env_var.SHELL]["activate_file"]).is_file() and (env / "bin/python").is_file()
+    # A file inside of ``env`` can only exist if ``env`` is a directory, so no separate check is needed
+    return os.path.isfile(os.path.join(env, SHELLS[env_var.SHELL]["activate_file"])) and \
+        os.path.isfile(os.path.join(env, "bin/python"))
 
 
 def is_active_virtual_env(env: VirtualEnv) -> bool:
@@ -47,7 +53,7 @@ def ensure_virtual_env(env: Path) -> VirtualEnv:
     :exception NotADirectoryError: Raised if the path is not a directory.
     :exception SystemError: Raised if the path is not a venv.
     """
-    if not env.is_dir():
+    if not os.path.isdir(env):
         raise NotADirectoryError(f"Virtual environment directory not found: {env}")
     if not is_virtual_env(env):
         raise SystemError(f"Not a virtual environment: {env}")
@@ -56,6 +62,45 @@ def ensure_virtual_env(env: Path) -> VirtualEnv:
 
 # Could be used: pip --require-virtualenv [commands...]
 
+# Arguments passed to every ``pip install`` call, see ``install_all``
+_PIP_INSTALL_ARGS = ("install", "--no-input")
+
+# Arguments passed to ``pip install`` to install packages quickly, see ``install_all``
+_FAST_INSTALL_ARGS = ("--only-binary=:all:", "--no-compile")
+
+# Passed as ``close_fds`` when starting an executable of a virtual environment by its path (e.g. pip).
+# File descriptors opened by python are not inherited by subprocesses anyway. Not closing them allows ``subprocess``
+# to start the process using ``posix_spawn`` instead of ``fork`` and ``exec``.
+SUBPROCESS_CLOSE_FDS = False
+
+
+def _get_pip_command(env: VirtualEnv, args: Sequence[str]) -> List[str]:
+    """
+    Creates the command line running the ``pip`` command of a virtual environment.
+
+    Every call starts a new ``pip`` process, so pip's check for a newer version of itself, which may access the
+    network, is disabled for all calls.
+
+    :param env: The environment whose ``pip`` to use.
+    :param args: The arguments to pass to ``pip``, starting with the pip command (e.g. ``install``).
+    :return: The command to pass to ``subprocess``.
+    """
+    return [os.path.join(env, "bin/pip"), "--disable-pip-version-check", *args]
+
+
+def _run_pip(env: VirtualEnv, args: List[str], capture_output: bool) -> "subprocess.CompletedProcess":
+    """
+    Runs the ``pip`` command of a virtual environment as subprocess.
+
+    :param env: The environment whose ``pip`` to use.
+    :param args: The arguments to pass to ``pip``, starting with the pip command (e.g. ``install``).
+    :param capture_output: Whether to capture the output of ``pip`` instead of printing it to console.
+    :return: The finished ``pip`` process.
+    """
+    import subprocess
+    return subprocess.run(_get_pip_command(env, args), capture_output=capture_output, close_fds=SUBPROCESS_CLOSE_FDS)
+
+
 def get_env_packages(env: VirtualEnv) -> List[str]:
     """
     Uses the ``pip`` command to list all installed packages of a virtual environment and converts it to a python list.
@@ -65,29 +110,28 @@ def get_env_packages(env: VirtualEnv) -> List[str]:
     :param env: The environment whose ``pip`` to use. This will list all packages from that environment.
     :return: A list of all packages installed in the specified virtual environment.
         A common output format is ``package==version``.
+    :exception PipError: Raised if ``pip freeze`` failed.
     """
-    try:
-        log("Reading package list from", env)
-        process = subprocess.run([env / "bin/pip", "freeze"], capture_output=True)
-    except subprocess.CalledProcessError as e:
-        log("Failed to fetch package list:", e)
-        raise RuntimeError(f"Cannot read package list from {env}")
+    log("Reading package list from", env)
+    process = _run_pip(env, ["freeze"], capture_output=True)
 
     if process.returncode != 0:
         if process.stderr:
             log(process.stderr.decode())
-        raise RuntimeError(
-            f"Cannot read package list, command 'pip freeze' terminated with exit code {process.returncode}"
+        raise PipError(
+            f"Cannot read package list, command 'pip freeze' terminated with exit code {process.returncode}",
+            process.returncode, process.stderr
         )
 
     # Create package list
-    packages: List[str] = list(filter(lambda x: x, process.stdout.decode().split("\n")))
-    log("Packages:", ", ".join(packages))
+    packages: List[str] = [line.decode() for line in process.stdout.splitlines() if line]
+    if is_debug_enabled():
+        log("Packages:", ", ".join(packages))
 
     return packages
 
 
-def install_packages(env: VirtualEnv, packages: List[str], no_output: bool) -> bool:
+def install_packages(env: VirtualEnv, packages: List[str], no_output: bool, fast: Optional[bool] = None) -> bool:
     """
     Installs all mentioned packages (with given versions) into the specified virtual environment.
 
@@ -96,26 +140,16 @@ def install_packages(env: VirtualEnv, packages: List[str], no_output: bool) -> b
     :param env: The environment to install packages into.
     :param packages: The list of packages (with given versions) to install (see also ``get_venv_packages``).
     :param no_output: If ``True``, all output from ``pip`` will be hidden from console.
+    :param fast: If ``True``, only prebuilt wheels are installed and no bytecode is compiled. Packages only available
+        as source distribution will fail to install. If ``None``, this is enabled by setting ``SNAPE_FAST_INSTALL=1``.
     :return: Whether installation succeeded for all packages.
     """
-    if len(packages) == 0:
-        log("No packages to install")
-        return True
+    return install_all(env, packages, [], no_output, fast)
 
-    process = subprocess.run([env / "bin/pip", "install"] + packages, capture_output=no_output)
 
-    # Output stdout
-    if process.stdout:
-        log(process.stdout.decode())
-    # Output errors
-    if process.returncode != 0:
-        if process.stderr:
-            log("ERRORS:", process.stderr.decode())
-        return False
-    return True
-
-
-def install_requirements(env: VirtualEnv, requirements_file: Path, no_output: bool) -> bool:
+def install_requirements(
+        env: VirtualEnv, requirements_file: Path, no_output: bool, fast: Optional[bool] = None
+) -> bool:
     """
     Installs all packages from a requirements file into the specified virtual environment.
 
@@ -124,15 +158,60 @@ def install_requirements(env: VirtualEnv, requirements_file: Path, no_output: bo
     :param env: The environment to install packages into.
     :param requirements_file: The file to read the package list from.
     :param no_output: If ``True``, all output from ``pip`` will be hidden from console.
+    :param fast: If ``True``, only prebuilt wheels are installed and no bytecode is compiled. Packages only available
+        as source distribution will fail to install. If ``None``, this is enabled by setting ``SNAPE_FAST_INSTALL=1``.
     :return: Whether installation succeeded for all packages.
     """
-    info("Installing requirements from", requirements_file)
-    process = subprocess.run(
-        [env / "bin/pip", "install", "-r", str(requirements_file)],
-        capture_output=no_output
-    )
-    if process.stdout:
-        log(process.stdout.decode())
-    if process.stderr:
-        log("ERRORS:", process.stderr.decode())
+    return install_all(env, [], [requirements_file], no_output, fast)
+
+
+def install_all(
+        env: VirtualEnv, packages: List[str], requirements_files: List[Path], no_output: bool,
+        fast: Optional[bool] = None
+) -> bool:
+    """
+    Installs all mentioned packages and all packages from the requirements files into the specified virtual
+    environment using a single ``pip`` call, so the dependencies of all packages are only resolved once.
+
+    This function calls ``pip install -r requirements_file... *packages`` as subprocess.
+    If the output is hidden, it is passed on to the debug log line by line while ``pip`` is running.
+
+    :param env: The environment to install packages into.
+    :param packages: The list of packages (with given versions) to install (see also ``get_venv_packages``).
+    :param requirements_files: The files to read further packages from.
+    :param no_output: If ``True``, all output from ``pip`` will be hidden from console.
+    :param fast: If ``True``, only prebuilt wheels are installed and no bytecode is compiled. Packages only available
+        as source distribution will fail to install. If ``None``, this is enabled by setting ``SNAPE_FAST_INSTALL=1``.
+    :return: Whether installation succeeded for all packages.
+    """
+    if len(packages) == 0 and len(requirements_files) == 0:
+        log("No packages to install")
+        return True
+
+    # Build the command line in place
+    command = _get_pip_command(env, _PIP_INSTALL_ARGS)
+    if fast is None:
+        fast = env_var.SNAPE_FAST_INSTALL == "1"
+    if fast:
+        log("Installing prebuilt wheels only")
+        command += _FAST_INSTALL_ARGS
+    for requirements_file in requirements_files:
+        info("Installing requirements from", requirements_file)
+        command += ("-r", str(requirements_file))
+    command += packages
+
+    import subprocess
+    if not no_output:
+        return subprocess.run(command, close_fds=SUBPROCESS_CLOSE_FDS).returncode == 0
+    if not is_debug_enabled():
+        return subprocess.run(
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=SUBPROCESS_CLOSE_FDS
+        ).returncode == 0
+
+    # Log the output of pip (including errors) as soon as it is written, without buffering all of it first
+    with subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, close_fds=SUBPROCESS_CLOSE_FDS
+    ) as process:
+        for line in process.stdout:
+            log(line.rstrip("\n"))
     return process.returncode == 0
@@ -28,8 +28,10 @@ OTHER_FILES: Final[Path] = TEST_DIR / "other"
 
 
 def _setup_snape():
-    sys.path.append(str(SNAPE_REPO))
-    sys.path.append(str(SNAPE_TEST_REPO))
+    # Running the setup again (e.g. after reloading this module) must not add duplicate paths
+    for path in (str(SNAPE_REPO), str(SNAPE_TEST_REPO)):
+        if path not in sys.path:
+            sys.path.append(path)
 
     GLOBAL_ENV_ROOT.mkdir(parents=True, exist_ok=True)
     WORKING_DIR.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import snape
+from snape_test import WORKING_DIR
+
+# Snape is run in a new interpreter, so no subcommand has been registered before
+_SNAPE_SRC = str(Path(snape.__file__).parent.parent)
+
+
+def _run_python(*lines: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=_SNAPE_SRC, COLUMNS="80")
+    return subprocess.run(
+        [sys.executable, "-c", "\n".join(lines)], env=env, cwd=WORKING_DIR, capture_output=True, text=True
+    )
+
+
+def test_lazy_dispatch():
+    process = _run_python(
+        "import sys",
+        "from snape.cli._parser import subcommands",
+        "from snape.cli.main import _load_selected_command",
+        "_load_selected_command(['-v', '-s', 'bash', 'status', '-r'])",
+        "print(*subcommands.choices)",
+        "print('snape.cli.commands.new' in sys.modules)"
+    )
+
+    assert process.stdout.splitlines() == ["status", "False"]
+
+
+def test_error_usage():
+    # Without a known subcommand, all subcommands are registered before parsing
+    all_commands = _run_python("from snape.cli import main", "main(['--bogus'])")
+    single_command = _run_python("from snape.cli import main", "main(['new', '--bogus'])")
+
+    usage, _, error = single_command.stderr.partition("snape: error: ")
+
+    assert all_commands.returncode == single_command.returncode == 2
+    assert "{attach,possess," in usage
+    assert all_commands.stderr.startswith(usage)
+    assert error == "unrecognized arguments: --bogus\n"
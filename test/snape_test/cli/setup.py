@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from snape import env_var
+from snape.annotations import SnapeCancel
+from snape.cli.commands import setup
+from snape.cli.commands.setup import _contains_line, snape_setup_init, snape_setup_remove
+
+
+def _use_init_file(monkeypatch, init_file) -> bytes:
+    # Never touch the init file of the user running the tests
+    snape_shell_script = env_var.SNAPE_REPO_PATH / "init" / f"snape.{env_var.SHELL}"
+    source_line = f"source '{snape_shell_script}'"
+    monkeypatch.setattr(setup, "_get_shell_paths", lambda shell: (snape_shell_script, init_file, source_line))
+    return source_line.encode()
+
+
+def test_contains_line(tmp_path):
+    file = tmp_path / "file"
+
+    for content in (
+            b"source x\n", b"source x", b"a\nsource x", b"a\nsource x\n", b"source x\nb", b"a\nsource x\nb\n",
+            # CRLF line endings, at the end of the file and before other lines
+            b"a\r\nsource x\r\n", b"source x\r\nb\r\n"
+    ):
+        file.write_bytes(content)
+        with open(file, "rb") as f:
+            assert _contains_line(f, b"source x"), content
+
+    for content in (b"", b"\n", b"source xy", b"a\n# source x", b"source x \nb", b"source", b"a\r\nsource xy\r\n"):
+        file.write_bytes(content)
+        with open(file, "rb") as f:
+            assert not _contains_line(f, b"source x"), content
+
+
+def test_init_remove(tmp_path, monkeypatch):
+    init_file = tmp_path / "init"
+    # No trailing newline
+    init_file.write_bytes(b"first\nlast")
+    source_line = _use_init_file(monkeypatch, init_file)
+
+    snape_setup_init()
+    assert init_file.read_bytes() == b"first\nlast\n" + source_line + b"\n"
+
+    with pytest.raises(SnapeCancel):
+        snape_setup_init()
+
+    snape_setup_remove(["init"])
+    assert init_file.read_bytes() == b"first\nlast\n"
+    assert list(tmp_path.iterdir()) == [init_file]
+
+
+def test_init_new_file(tmp_path, monkeypatch):
+    init_file = tmp_path / "init"
+    source_line = _use_init_file(monkeypatch, init_file)
+
+    snape_setup_init()
+    assert init_file.read_bytes() == source_line + b"\n"
+
+
+def test_remove_failure(tmp_path, monkeypatch):
+    init_file = tmp_path / "init"
+    source_line = _use_init_file(monkeypatch, init_file)
+    init_file.write_bytes(b"first\n" + source_line + b"\n")
+
+    def replace(*args):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(os, "replace", replace)
+    with pytest.raises(OSError):
+        snape_setup_remove(["init"])
+
+    # The init file is unchanged and the temporary file is removed
+    assert init_file.read_bytes() == b"first\n" + source_line + b"\n"
+    assert list(tmp_path.iterdir()) == [init_file]
+
+
+def test_init_remove_crlf(tmp_path, monkeypatch):
+    init_file = tmp_path / "init"
+    source_line = _use_init_file(monkeypatch, init_file)
+    init_file.write_bytes(b"first\r\n" + source_line + b"\r\n")
+
+    with pytest.raises(SnapeCancel):
+        snape_setup_init()
+    assert init_file.read_bytes() == b"first\r\n" + source_line + b"\r\n"
+
+    # Other lines keep their line endings
+    snape_setup_remove(["init"])
+    assert init_file.read_bytes() == b"first\r\n"
+    assert list(tmp_path.iterdir()) == [init_file]